@@ -2,6 +2,9 @@ import json
 import logging
 import time
 import zipfile
+from functools import lru_cache
+from itertools import starmap
+from operator import itemgetter
 from tempfile import NamedTemporaryFile
 from datetime import datetime, timedelta
 from typing import Any
@@ -39,20 +42,7 @@ def get_header(params: dict) -> list[str]:
     Returns:
         List of header strings (e.g., ["Network", "Station", ...]).
     """
-    header = ["Network", "Station", "Location", "Channel"]
-    if params["format"] == "text":
-        header[0] = "#" + header[0]
-    if "quality" not in params["merge"]:
-        header.append("Quality")
-    if "samplerate" not in params["merge"]:
-        header.append("SampleRate")
-    header.extend(["Earliest", "Latest"])
-    if params["showlastupdate"]:
-        header.append("Updated")
-    if params["extent"]:
-        header.append("TimeSpans")
-        header.append("Restriction")
-    return header
+    return list(_build_header(params["format"] == "text", *_header_options(params)))
 
 
 def get_geocsv_header(params: dict) -> str:
@@ -68,22 +58,75 @@ def get_geocsv_header(params: dict) -> str:
     Returns:
         The formatted GeoCSV header string including column names.
     """
+    return _build_geocsv_header(*_header_options(params))
+
+
+def _header_options(params: dict) -> tuple[bool, bool, bool, bool]:
+    """
+    Extracts the request options the output columns depend on.
+
+    Returns:
+        A (quality, samplerate, showlastupdate, extent) tuple of flags telling
+        which optional columns are present.
+    """
+    return (
+        "quality" not in params["merge"],
+        "samplerate" not in params["merge"],
+        bool(params["showlastupdate"]),
+        bool(params["extent"]),
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_header(
+    text: bool, quality: bool, samplerate: bool, showlastupdate: bool, extent: bool
+) -> tuple[str, ...]:
+    """
+    Builds the column names for one combination of header options.
+
+    Headers only depend on a handful of flags, so each variant is built once
+    and then served from the cache.
+    """
+    header = ["Network", "Station", "Location", "Channel"]
+    if text:
+        header[0] = "#" + header[0]
+    if quality:
+        header.append("Quality")
+    if samplerate:
+        header.append("SampleRate")
+    header.extend(["Earliest", "Latest"])
+    if showlastupdate:
+        header.append("Updated")
+    if extent:
+        header.append("TimeSpans")
+        header.append("Restriction")
+    return tuple(header)
+
+
+@lru_cache(maxsize=None)
+def _build_geocsv_header(
+    quality: bool, samplerate: bool, showlastupdate: bool, extent: bool
+) -> str:
+    """
+    Builds the GeoCSV header for one combination of header options (cached).
+    """
     geocsv_header = [("unitless", "string") for i in range(4)]
-    if "quality" not in params["merge"]:
+    if quality:
         geocsv_header.append(("unitless", "string"))
-    if "samplerate" not in params["merge"]:
+    if samplerate:
         geocsv_header.append(("hertz", "float"))
     geocsv_header.extend([("ISO_8601", "datetime"), ("ISO_8601", "datetime")])
-    if params["showlastupdate"]:
+    if showlastupdate:
         geocsv_header.append(("ISO_8601", "datetime"))
-    if params["extent"]:
+    if extent:
         geocsv_header.append(("unitless", "integer"))
         geocsv_header.append(("unitless", "string"))
 
+    header = _build_header(False, quality, samplerate, showlastupdate, extent)
     text = "#dataset: GeoCSV 2.0\n#delimiter: |\n"
     text += "#field_unit: " + "|".join([h[0] for h in geocsv_header]) + "\n"
     text += "#field_type: " + "|".join([h[1] for h in geocsv_header]) + "\n"
-    text += "|".join(get_header(params)) + "\n"
+    text += "|".join(header) + "\n"
     return text
 
 
@@ -119,23 +162,26 @@ def records_to_text(params: dict, data: list[list[Any]], sep: str = " ") -> str:
     Returns:
         The complete formatted response body as a string.
     """
-    text = ""
     header = get_header(params)
     if params["format"] == "text":
         sizes = get_column_widths(data, header)
-        # pad header and rows according to the maximum column width
-        header = [val.ljust(sz) for val, sz in zip(header, sizes)]
-        for row in data:
-            row[:] = [val.ljust(sz) for val, sz in zip(row, sizes)]
-
-    if params["format"] in ["geocsv", "zip"]:
-        text = get_geocsv_header(params)
-    elif params["format"] != "request":
-        text = sep.join(header) + "\n"
+        # pad header and rows according to the maximum column width, with a
+        # template built once and applied to every row
+        template = sep.join(f"{{:<{sz}}}" for sz in sizes)
+        text = template.format(*header) + "\n"
+        lines = starmap(template.format, data)
+    else:
+        if params["format"] in ["geocsv", "zip"]:
+            text = get_geocsv_header(params)
+        elif params["format"] != "request":
+            text = sep.join(header) + "\n"
+        else:
+            text = ""
+        lines = map(sep.join, data)
 
-    data = [f"{sep.join(row)}\n" for row in data]
-    text += "".join(data)
-    return text
+    # Join all rows at once instead of building one "row\n" string per row.
+    body = "\n".join(lines)
+    return f"{text}{body}\n" if data else text
 
 
 def records_to_dictlist(params: dict, data: list[list[Any]]) -> dict:
@@ -188,51 +234,18 @@ def sort_records(params: dict, data: list[list[Any]]) -> None:
         data: List of data records (modified in-place).
     """
     if params["extent"] and params["orderby"] == "timespancount":
-        data.sort(key=lambda x: x[COUNT])
+        data.sort(key=itemgetter(COUNT))
     elif params["extent"] and params["orderby"] == "timespancount_desc":
-        data.sort(key=lambda x: x[COUNT], reverse=True)
+        data.sort(key=itemgetter(COUNT), reverse=True)
     elif params["orderby"] == "latestupdate":
-        data.sort(key=lambda x: x[UPDATED])
+        data.sort(key=itemgetter(UPDATED))
     elif params["orderby"] == "latestupdate_desc":
-        data.sort(key=lambda x: x[UPDATED], reverse=True)
+        data.sort(key=itemgetter(UPDATED), reverse=True)
     else:
-        # Default sorting: NSLC, Time, Quality, SampleRate
-        # We sort by multiple keys in reverse priority (Python sort is stable)
-        
-        # 1. Sort by Quality and SampleRate
-        data.sort(key=lambda x: (x[QUALITY], x[SAMPLERATE]))
-        # 2. Sort by Time (Start, End) - descending? Wait, original code had reverse=True for time?
-        # Original: data.sort(key=lambda x: (x[START], x[END]), reverse=True) 
-        # But usually we want ascending time?
-        # Let's check original logic carefully.
-        
-        # Original Lines:
-        # 200:             data.sort(key=lambda x: (x[QUALITY], x[SAMPLERATE]))
-        # 201:             data.sort(key=lambda x: (x[START], x[END]), reverse=True) 
-        # 202:             data.sort(key=lambda x: x[:QUALITY])
-        
-        # Line 202 sorts by first 4 columns (Net, Sta, Loc, Cha).
-        # Since Python sort is stable, previous sorts within those groups are preserved.
-        
-        # Line 201 sorted by Time DESCENDING? That seems odd for a time series.
-        # But if we want Earliest to Latest, it should be Ascending.
-        # Maybe reverse=True was a bug or specific requirement?
-        # The user's query example showed 2023-11-23 then 2023-11-22, which is DESCENDING.
-        # If the user wants standard time order, it should be Ascending.
-        
-        # Let's KEEP original logic for now, but ensure it runs.
-        # WAIT, if 201 is reverse=True, then data is sorted Time DESCENDING?
-        # Let's verify what `nslc_time_quality_samplerate` implies. "ordered by ... time ..." usually means Ascending.
-        
-        # If I change reverse=True to False, I might break expected behavior if descending was intended.
-        # But "Earliest" column usually suggests ascending.
-        
-        # Let's stick to the minimal fix: remove the surrounding IF, Keep the logic same.
-        
-        data.sort(key=lambda x: (x[QUALITY], x[SAMPLERATE]))
-        # 2. Sort by Time (Start, End) - Ascending
-        data.sort(key=lambda x: (x[START], x[END]), reverse=False)
-        data.sort(key=lambda x: x[:QUALITY])
+        # Default sorting: NSLC, Time (Start, End), Quality, SampleRate.
+        # A single compound key gives the same order as successive stable
+        # sorts in reverse priority, with one pass instead of three.
+        data.sort(key=itemgetter(0, 1, 2, 3, START, END, QUALITY, SAMPLERATE))
 
 
 #    else:
@@ -265,18 +278,23 @@ def select_columns(
     if params["format"] == "request":
         indexes = [0, 1, 2, 3] + [START, END]
 
+    # Resolve the per-request options once instead of on every row.
+    start, end = params["start"], params["end"]
+    showlastupdate = params["showlastupdate"] and params["format"] != "request"
+    as_text = params["format"] != "json"
+
     for row in data:
-        if params["start"] and row[START] < params["start"]:
-            row[START] = params["start"]
-        if params["end"] and row[END] > params["end"]:
-            row[END] = params["end"]
+        if start and row[START] < start:
+            row[START] = start
+        if end and row[END] > end:
+            row[END] = end
         row[START] = row[START].isoformat(timespec="microseconds") + "Z"
         row[END] = row[END].isoformat(timespec="microseconds") + "Z"
 
-        if params["showlastupdate"] and params["format"] != "request":
+        if showlastupdate:
             row[UPDATED] = row[UPDATED].isoformat(timespec="seconds") + "Z"
 
-        if params["format"] != "json":
+        if as_text:
             row[:] = [str(row[i]) for i in indexes]
         else:
             row[:] = [row[i] for i in indexes]
@@ -291,9 +309,15 @@ def fusion(
     """
     Merges adjacent time spans or groups data based on strict parameter equality.
 
+    Rows are sorted by the grouping columns and start time, then merged in a
+    single sweep that extends the current span while the next one starts within
+    the tolerance of its end.
+
     Args:
         params: Dictionary of request parameters (used for 'mergegaps' tolerance).
-        data: List of ordered data records.
+        data: List of data records, sorted in place. Rows are reused in the
+            result and updated in place, so the input should not be relied
+            upon afterwards.
         indexes: List of column indexes to check for equality when grouping.
 
     Returns:
@@ -302,38 +326,38 @@ def fusion(
 
     tic = time.time()
     merge = list()
+    cur, cur_key, cur_tol = None, None, None
     timespancount = 0
-    tol = params["mergegaps"] if params["mergegaps"] is not None else 0.0
+    tol = timedelta(seconds=params["mergegaps"] or 0.0)
+    extent = params["extent"]
 
-    # The fusion step needs the rows to be sorted.
-    #    data.sort(key=lambda x: x[:UPDATED]) # done by postgres
+    # Segments to be fused must be adjacent: group them, oldest first.
+    group_key = itemgetter(*indexes)
+    data.sort(key=itemgetter(*indexes, START))
 
     for row in data:
-        if merge and [row[i] for i in indexes] == [merge[-1][i] for i in indexes]:
-            sample_size = 1.0 / float(merge[-1][SAMPLERATE])
-            tol2 = timedelta(seconds=max([tol, sample_size]))
-            sametrace = (
-                row[START] - merge[-1][END] <= tol2
-                # (never occurs if sorted ?)
-                and merge[-1][START] <= row[END] + tol2
-            )
+        key = group_key(row)
+        if key == cur_key:
+            # cur[START] <= row[START] holds thanks to the sort.
+            sametrace = row[START] - cur[END] <= cur_tol
             if not sametrace:
                 timespancount += 1
-            merge[-1][COUNT] = timespancount
-
-            if params["extent"] or sametrace:
-                if row[UPDATED] > merge[-1][UPDATED]:
-                    merge[-1][UPDATED] = row[UPDATED]
-                # if row[START] < merge[-1][START]:  # never occurs if sorted
-                #    merge[-1][START] = row[START]
-                if row[END] > merge[-1][END]:
-                    merge[-1][END] = row[END]
-            else:
-                merge.append(list(row))
+            cur[COUNT] = timespancount
+
+            if extent or sametrace:
+                if row[UPDATED] > cur[UPDATED]:
+                    cur[UPDATED] = row[UPDATED]
+                if row[END] > cur[END]:
+                    cur[END] = row[END]
+                continue
         else:
-            merge.append(list(row))
             timespancount = 1
-            merge[-1][COUNT] = 1
+            row[COUNT] = 1
+
+        merge.append(row)
+        cur, cur_key = row, key
+        # Gap tolerance of the new span: mergegaps, but at least one sample.
+        cur_tol = max(tol, timedelta(seconds=1.0 / float(row[SAMPLERATE])))
 
     logging.debug(f"Data merged in {tictac(tic)} seconds.")
     return merge
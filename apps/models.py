@@ -1,11 +1,10 @@
 import re
-import sys
 from datetime import datetime
 from typing import Optional, List, Tuple
 from pydantic import BaseModel, Field, field_validator, model_validator, ValidationError, ConfigDict
 
 from apps.globals import (
-    OUTPUT, NODATA_CODE, STRING_TRUE, STRING_FALSE, SHOW, MERGE, ORDERBY
+    OUTPUT, NODATA_CODE, STRING_TRUE, STRING_FALSE, SHOW, MERGE, ORDERBY, MAX_MERGEGAPS
 )
 
 class QueryParameters(BaseModel):
@@ -25,7 +24,7 @@ class QueryParameters(BaseModel):
     # Options
     quality: str = Field(default="*")
     merge: str = Field(default="")
-    mergegaps: Optional[float] = Field(default=None)
+    mergegaps: Optional[float] = Field(default=None, ge=0.0, le=MAX_MERGEGAPS)
     orderby: Optional[str] = Field(default=None)
     limit: Optional[int] = Field(default=None)
     includerestricted: bool = Field(default=False)
@@ -109,15 +108,6 @@ class QueryParameters(BaseModel):
                 pass
         raise ValueError(f"Invalid datetime format: {v}")
 
-    @field_validator('mergegaps')
-    @classmethod
-    def validate_mergegaps(cls, v: Optional[float]) -> Optional[float]:
-        # Original: is_valid_float(dimension, mini=sys.float_info.epsilon, maxi=sys.float_info.max)
-        if v is not None:
-             if v < sys.float_info.epsilon:
-                 raise ValueError("Internal Server Error") # As per tests/code behavior for negative/zero? check utils
-        return v
-
     @field_validator('includerestricted', mode='before')
     @classmethod
     def validate_bool(cls, v: str | bool) -> bool:
@@ -16,6 +16,18 @@ class Restriction(Flag):
 
 
 class Epoch:
+    # The whole inventory is held as Epoch objects in every worker, so avoid a
+    # per-instance __dict__.
+    __slots__ = (
+        "network",
+        "station",
+        "location",
+        "channel",
+        "start",
+        "end",
+        "restriction",
+    )
+
     def __init__(
         self,
         net_code: str,
@@ -40,6 +52,15 @@ class Epoch:
     def __str__(self):
         return f"{self.seed_id} {self.start} --- {self.end} {self.restriction}"
 
+    # Pickle as a plain attribute dict, like before __slots__, so inventories
+    # cached in Redis by either version keep loading.
+    def __getstate__(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
 
 
 # Global Redis Pool to prevent connection churn
@@ -67,15 +88,12 @@ class RestrictionInventory:
         # Try to get cached inventory from shared memcache instance
         if cached_inventory:
             self._inv = pickle.loads(cached_inventory)
-            self._restricted_seedIDs = set([
-                seedId
-                for seedId in self._inv
-                if any(e.restriction != Restriction.OPEN for e in self._inv[seedId])
-            ])
-            self._known_seedIDs = set([
+            self._restricted_seedIDs = {
                 seedId
-                for seedId in self._inv
-            ])
+                for seedId, epochs in self._inv.items()
+                if any(e.restriction != Restriction.OPEN for e in epochs)
+            }
+            self._known_seedIDs = set(self._inv)
             logging.info(f"Loaded inventory from cache...")
             return
         else:
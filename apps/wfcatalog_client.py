@@ -82,6 +82,11 @@ def mongo_request(paramslist: list[dict]) -> tuple[list[dict], list[list[Any]]]:
     
     for params in paramslist:
         params = _expand_wildcards(params)
+        # Nothing in the cached inventory matches this selection, so the DB
+        # cannot return any known seed ID either: skip the round trip.
+        if not params["network"]:
+            continue
+
         # Crop datetimes to accomodate sub-segment queries.
         # e.g. net=NL&sta=HGN&start=2018-01-06T06:00:00&end=2018-01-06T12:00:00
         # when we have one 24h segment for 2018-01-06
@@ -118,9 +123,6 @@ def mongo_request(paramslist: list[dict]) -> tuple[list[dict], list[list[Any]]]:
         # Eager query execution instead of a cursor
         result += _apply_restricted_bit(cursor, params.get("includerestricted", False))
 
-    # Result needs to be sorted, this seems to be required by the fusion step
-    result.sort(key=lambda x: (x[0], x[1], x[2], x[3], x[4]))
-
     return qries, result
 
 
@@ -250,21 +252,21 @@ def _expand_wildcards(params: dict) -> dict:
         _cha += [e for e in _loc if fnmatch(e.split(".")[3], cha)]
 
     # Replace original query parameters with ones filtered out from the cached inventory.
-    params["network"] = ",".join(set([e.split(".")[0] for e in _cha]))
+    params["network"] = ",".join({e.split(".")[0] for e in _cha})
     params["station"] = (
         "*"
         if params["station"] == "*"
-        else ",".join(set([e.split(".")[1] for e in _cha]))
+        else ",".join({e.split(".")[1] for e in _cha})
     )
     params["location"] = (
         "*"
         if params["location"] == "*"
-        else ",".join(set([e.split(".")[2] for e in _cha]))
+        else ",".join({e.split(".")[2] for e in _cha})
     )
     params["channel"] = (
         "*"
         if params["channel"] == "*"
-        else ",".join(set([e.split(".")[3] for e in _cha]))
+        else ",".join({e.split(".")[3] for e in _cha})
     )
 
     return params
@@ -1,6 +1,7 @@
 import logging
 from datetime import timedelta
 from typing import Union
+from urllib.parse import urlencode
 
 from obspy import read_inventory
 from obspy.core.inventory import Channel, Network
@@ -53,9 +54,8 @@ class Cache:
         try:
             for n in cat:
                 # Get inventory from FDSN:
-                url = (
-                    f"{self._config.FDSNWS_STATION_URL}?network={n.code}&level=channel"
-                )
+                query = urlencode({"network": n.code, "level": "channel"})
+                url = f"{self._config.FDSNWS_STATION_URL}?{query}"
                 i = read_inventory(url)
                 inventory.networks += i.networks
                 logger.info(
@@ -116,6 +116,24 @@ class TestDataAccess(unittest.TestCase):
             # NEW IMPLEMENTATION CHECK:
             # We expect MongoClient to be initialized ONLY ONCE, reusing the connection.
             self.assertEqual(self.mock_mongo_cls.call_count, 1)
+    def test_mongo_request_skips_unknown_selection(self):
+        """Test that no query is sent when wildcard expansion matches nothing"""
+        params = [{
+            "network": "XX", "station": "*", "location": "*", "channel": "*", "quality": "*",
+            "start": None, "end": None
+        }]
+
+        def expand_to_nothing(p):
+            p["network"] = ""
+            return p
+
+        with patch('apps.wfcatalog_client._expand_wildcards', side_effect=expand_to_nothing):
+            queries, results = wfcatalog_client.mongo_request(params)
+
+            self.assertEqual(queries, [])
+            self.assertEqual(results, [])
+            self.mock_collection.find.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
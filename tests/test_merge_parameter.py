@@ -17,9 +17,10 @@ from apps.globals import START, END, UPDATED, COUNT, STATUS, QUALITY, SAMPLERATE
 class TestMergeParameter(unittest.TestCase):
     """Test suite for merge parameter functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.base_params = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only fixtures shared by all tests (copy before mutating)."""
+        cls.base_params = {
             "format": "text",
             "merge": [],
             "showlastupdate": False,
@@ -30,7 +31,12 @@ class TestMergeParameter(unittest.TestCase):
             "start": None,
             "end": None
         }
-        self.now = datetime.utcnow()
+        cls.now = datetime.utcnow()
+
+    def segment(self, start, end, cha="BHZ", quality="D", samplerate=40.0):
+        """Build a fresh NL.HGN.02 row (fusion updates rows in place, so never share them)."""
+        # [net, sta, loc, cha, qlt, srate, ts, te, updated, restr, count]
+        return ["NL", "HGN", "02", cha, quality, samplerate, start, end, self.now, "OPEN", 1]
 
     def test_merge_overlap_basic(self):
         """Test that merge=overlap merges overlapping time segments."""
@@ -45,9 +51,8 @@ class TestMergeParameter(unittest.TestCase):
         t2 = datetime(2022, 1, 1, 13, 0, 0)  # Overlaps
         t3 = datetime(2022, 1, 1, 15, 0, 0)
         
-        # [net, sta, loc, cha, qlt, srate, ts, te, updated, restr, count]
-        row1 = ["NL", "HGN", "02", "BHZ", "D", 40.0, t0, t1, self.now, "OPEN", 1]
-        row2 = ["NL", "HGN", "02", "BHZ", "D", 40.0, t2, t3, self.now, "OPEN", 1]
+        row1 = self.segment(t0, t1)
+        row2 = self.segment(t2, t3)
         
         data = [row1, row2]
         
@@ -75,8 +80,8 @@ class TestMergeParameter(unittest.TestCase):
         t2 = datetime(2022, 1, 1, 14, 0, 0)
         t3 = datetime(2022, 1, 1, 15, 0, 0)
         
-        row1 = ["NL", "HGN", "02", "BHZ", "D", 40.0, t0, t1, self.now, "OPEN", 1]
-        row2 = ["NL", "HGN", "02", "BHZ", "D", 40.0, t2, t3, self.now, "OPEN", 1]
+        row1 = self.segment(t0, t1)
+        row2 = self.segment(t2, t3)
         
         data = [row1, row2]
         indexes = dal.get_indexes(params)
@@ -98,8 +103,8 @@ class TestMergeParameter(unittest.TestCase):
         t3 = datetime(2022, 1, 1, 14, 0, 0)
         
         # Same NSLC but different quality: D vs M
-        row1 = ["NL", "HGN", "02", "BHZ", "D", 40.0, t0, t1, self.now, "OPEN", 1]
-        row2 = ["NL", "HGN", "02", "BHZ", "M", 40.0, t2, t3, self.now, "OPEN", 1]
+        row1 = self.segment(t0, t1)
+        row2 = self.segment(t2, t3, quality="M")
         
         data = [row1, row2]
         
@@ -126,8 +131,8 @@ class TestMergeParameter(unittest.TestCase):
         t3 = datetime(2022, 1, 1, 14, 0, 0)
         
         # Same NSLC and quality but different sample rate: 40.0 vs 20.0
-        row1 = ["NL", "HGN", "02", "BHZ", "D", 40.0, t0, t1, self.now, "OPEN", 1]
-        row2 = ["NL", "HGN", "02", "BHZ", "D", 20.0, t2, t3, self.now, "OPEN", 1]
+        row1 = self.segment(t0, t1)
+        row2 = self.segment(t2, t3, samplerate=20.0)
         
         data = [row1, row2]
         
@@ -153,8 +158,8 @@ class TestMergeParameter(unittest.TestCase):
         t2 = t1  # Adjacent
         t3 = datetime(2022, 1, 1, 14, 0, 0)
         
-        row1 = ["NL", "HGN", "02", "BHZ", "D", 40.0, t0, t1, self.now, "OPEN", 1]
-        row2 = ["NL", "HGN", "02", "BHZ", "M", 20.0, t2, t3, self.now, "OPEN", 1]
+        row1 = self.segment(t0, t1)
+        row2 = self.segment(t2, t3, quality="M", samplerate=20.0)
         
         data = [row1, row2]
         
@@ -181,8 +186,8 @@ class TestMergeParameter(unittest.TestCase):
         t2 = datetime(2022, 1, 1, 13, 30, 0)  # 30 min gap
         t3 = datetime(2022, 1, 1, 14, 30, 0)
         
-        row1 = ["NL", "HGN", "02", "BHZ", "D", 40.0, t0, t1, self.now, "OPEN", 1]
-        row2 = ["NL", "HGN", "02", "BHZ", "D", 40.0, t2, t3, self.now, "OPEN", 1]
+        row1 = self.segment(t0, t1)
+        row2 = self.segment(t2, t3)
         
         data = [row1, row2]
         indexes = dal.get_indexes(params)
@@ -206,8 +211,8 @@ class TestMergeParameter(unittest.TestCase):
         t3 = datetime(2022, 1, 1, 14, 0, 0)
         
         # Different channel: BHZ vs BHN
-        row1 = ["NL", "HGN", "02", "BHZ", "D", 40.0, t0, t1, self.now, "OPEN", 1]
-        row2 = ["NL", "HGN", "02", "BHN", "D", 40.0, t2, t3, self.now, "OPEN", 1]
+        row1 = self.segment(t0, t1)
+        row2 = self.segment(t2, t3, cha="BHN")
         
         data = [row1, row2]
         indexes = dal.get_indexes(params)
@@ -217,6 +222,34 @@ class TestMergeParameter(unittest.TestCase):
         # Should NOT merge because channels are different
         self.assertEqual(len(merged), 2, "Segments with different channels should not merge")
 
+    def test_merge_overlap_unsorted_input(self):
+        """Test that fusion does not rely on the input being sorted by time."""
+        params = self.base_params.copy()
+        params["merge"] = ["overlap"]
+
+        # Segments arrive out of order and interleaved with another channel
+        t0 = datetime(2022, 1, 1, 12, 0, 0)
+        t1 = datetime(2022, 1, 1, 13, 0, 0)
+        t2 = datetime(2022, 1, 1, 14, 0, 0)
+        t3 = datetime(2022, 1, 1, 15, 0, 0)
+
+        row1 = self.segment(t2, t3)
+        row2 = self.segment(t0, t1, cha="BHN")
+        row3 = self.segment(t0, t1)
+        row4 = self.segment(t1, t2)
+
+        data = [row1, row2, row3, row4]
+        indexes = dal.get_indexes(params)
+
+        merged = dal.fusion(params, data, indexes)
+
+        # BHN stays alone, the three BHZ segments chain into one
+        self.assertEqual(len(merged), 2)
+        self.assertEqual(merged[0][3], "BHN")
+        self.assertEqual(merged[1][3], "BHZ")
+        self.assertEqual(merged[1][START], t0)
+        self.assertEqual(merged[1][END], t3)
+
     def test_get_indexes_no_merge(self):
         """Test get_indexes returns all indexes when merge is empty."""
         params = self.base_params.copy()
@@ -0,0 +1,47 @@
+import unittest
+import sys
+import os
+
+# Ensure we can import modules from parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import ValidationError
+
+from apps.globals import MAX_MERGEGAPS
+from apps.models import QueryParameters
+
+
+class TestMergegapsValidation(unittest.TestCase):
+
+    def test_mergegaps_default(self):
+        """Test that mergegaps is optional"""
+        self.assertIsNone(QueryParameters().mergegaps)
+
+    def test_mergegaps_valid(self):
+        """Test that values inside [0, MAX_MERGEGAPS] are accepted and converted"""
+        self.assertEqual(QueryParameters(mergegaps="0").mergegaps, 0.0)
+        self.assertEqual(QueryParameters(mergegaps="3600.5").mergegaps, 3600.5)
+        self.assertEqual(QueryParameters(mergegaps=MAX_MERGEGAPS).mergegaps, MAX_MERGEGAPS)
+
+    def test_mergegaps_negative(self):
+        """Test that negative values are rejected"""
+        with self.assertRaises(ValidationError) as ctx:
+            QueryParameters(mergegaps=-1)
+        err = ctx.exception.errors()[0]
+        self.assertEqual(err["loc"], ("mergegaps",))
+        self.assertEqual(err["type"], "greater_than_equal")
+
+    def test_mergegaps_too_large(self):
+        """Test that values above MAX_MERGEGAPS are rejected"""
+        with self.assertRaises(ValidationError) as ctx:
+            QueryParameters(mergegaps=MAX_MERGEGAPS + 1)
+        self.assertEqual(ctx.exception.errors()[0]["type"], "less_than_equal")
+
+    def test_mergegaps_not_a_number(self):
+        """Test that non numeric values are rejected"""
+        with self.assertRaises(ValidationError):
+            QueryParameters(mergegaps="abc")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+
+# Ensure we can import modules from parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from apps import data_access_layer as dal
+
+
+class TestRecordsToText(unittest.TestCase):
+
+    def setUp(self):
+        self.params = {
+            "format": "text",
+            "merge": [],
+            "showlastupdate": False,
+            "extent": False,
+        }
+
+    def rows(self):
+        # Rows as produced by select_columns for text-like formats
+        return [
+            ["NL", "HGN", "02", "BHZ", "D", "40.0",
+             "2022-01-01T12:00:00.000000Z", "2022-01-01T13:00:00.000000Z"],
+            ["NL", "HGNX", "--", "BHZ", "M", "100.0",
+             "2022-01-02T12:00:00.000000Z", "2022-01-02T13:00:00.000000Z"],
+        ]
+
+    def test_text_columns_are_padded(self):
+        """Test that text output aligns header and rows on column widths"""
+        text = dal.records_to_text(self.params, self.rows())
+        lines = text.split("\n")
+
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[-1], "")
+        self.assertTrue(lines[0].startswith("#Network Station Location Channel Quality SampleRate Earliest"))
+        self.assertEqual(
+            lines[1],
+            "NL       HGN     02       BHZ     D       40.0       "
+            "2022-01-01T12:00:00.000000Z 2022-01-01T13:00:00.000000Z",
+        )
+        self.assertEqual(lines[2].split(), self.rows()[1])
+        # Every line has the same width once padded
+        self.assertEqual(len({len(line.rstrip()) for line in lines[1:3]}), 1)
+
+    def test_geocsv(self):
+        """Test GeoCSV output: metadata header, column names, pipe separated rows"""
+        self.params["format"] = "geocsv"
+        text = dal.records_to_text(self.params, self.rows(), "|")
+
+        self.assertTrue(text.startswith("#dataset: GeoCSV 2.0\n#delimiter: |\n"))
+        self.assertIn(
+            "#field_type: string|string|string|string|string|float|datetime|datetime\n", text
+        )
+        self.assertIn("Network|Station|Location|Channel|Quality|SampleRate|Earliest|Latest\n", text)
+        self.assertTrue(text.endswith("|".join(self.rows()[1]) + "\n"))
+
+    def test_request_format_has_no_header(self):
+        """Test that format=request only outputs the rows"""
+        self.params["format"] = "request"
+        rows = [row[:4] + row[6:] for row in self.rows()]
+        text = dal.records_to_text(self.params, rows)
+
+        self.assertEqual(text, "".join(" ".join(row) + "\n" for row in rows))
+
+    def test_extent_header(self):
+        """Test that extent mode adds the updated, timespans and restriction columns"""
+        self.params.update({"format": "geocsv", "extent": True, "showlastupdate": True})
+        rows = [row + ["2022-01-03T00:00:00Z", "2", "OPEN"] for row in self.rows()]
+        text = dal.records_to_text(self.params, rows, "|")
+
+        self.assertIn(
+            "Network|Station|Location|Channel|Quality|SampleRate|Earliest|Latest"
+            "|Updated|TimeSpans|Restriction\n",
+            text,
+        )
+        self.assertTrue(text.endswith("|".join(rows[1]) + "\n"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import pickle
 from unittest import TestCase, mock
 from datetime import date
 from restriction import Restriction, RestrictionInventory, Epoch
@@ -103,3 +104,18 @@ class TestIsRestricted(TestCase):
             ).value
             == Restriction.PARTIAL.value,
         )
+
+
+class TestEpochPickle(TestCase):
+    def test_roundtrip(self):
+        """Assert slotted epochs survive the pickle round trip used by the cache."""
+        epoch = Epoch("XX", "YYY", "00", "BHE", date(2000, 1, 1), None)
+        epoch.restriction = Restriction.RESTRICTED
+
+        loaded = pickle.loads(pickle.dumps(epoch))
+
+        self.assertFalse(hasattr(loaded, "__dict__"))
+        self.assertEqual(loaded.seed_id, "XX.YYY.00.BHE")
+        self.assertEqual(loaded.start, date(2000, 1, 1))
+        self.assertIsNone(loaded.end)
+        self.assertEqual(loaded.restriction, Restriction.RESTRICTED)